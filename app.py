@@ -7,26 +7,60 @@ import pandas as pd
 st.set_page_config(page_title="Book Mood Recommender", layout="wide")
 st.title("📚 Book Lovers App")
 
+MOODS = {
+    "📖 Easy Reading": "score_easy",
+    "🚶 On the go": "score_on_the_go",
+    "🌙 Relaxing Bedtime Stories": "score_bedtime",
+    "🏖️ Beach Day": "score_beach",
+    "🧠 Make me Smarter": "score_educational",
+    "⚡ Adrenaline Rush": "score_adrenaline",
+}
+
+# only the columns the app uses (regenerate the file with src/csv_to_parquet.py)
+APP_COLUMNS = [
+    "title", "author", "rating", "rating_count", "description", "pages",
+    "top_mood", "top_mood_score",
+    *[f"{col}{suffix}" for col in MOODS.values() for suffix in ("", "_broad")],
+]
+
 @st.cache_data
 def load_data():
-    return pd.read_csv("data/processed/df_final_scored_with_descriptions.csv")
+    df = pd.read_parquet(
+        "data/processed/df_final_scored_with_descriptions.parquet",
+        engine="pyarrow",
+        columns=APP_COLUMNS,
+    )
+    # compact dtypes: Arrow-backed text, categoricals for repeated values
+    for col in ("title", "description"):
+        df[col] = df[col].astype("string[pyarrow]")
+    for col in ("author", "top_mood"):
+        df[col] = df[col].astype("category")
+    df["pages"] = df["pages"].astype("Int32")
+    df["rating"] = df["rating"].astype("float32")
+    return df
+
+@st.cache_data
+def precompute_rankings():
+    # Row positions of every book, best first, for each way of ranking
+    # results. Done once per data load so reruns never sort.
+    df = load_data()
+
+    def rank(by):
+        order = df.sort_values(by, ascending=False, kind="stable").index
+        return df.index.get_indexer(order)
+
+    rankings = {col: rank(col) for col in df.columns if col.startswith("score_")}
+    rankings["best_only"] = rank(["top_mood_score", "rating_count"])
+    return rankings
 
 df = load_data()
+rankings = precompute_rankings()
 
 # ====================
 # SIDEBAR — Filters
 # ====================
 st.sidebar.header("Customize your search")
 
-MOODS = {
-    "📖 Easy Reading": "score_easy",
-    "🚶 On the go": "score_on_the_go",
-    "🌙 Relaxing Bedtime Stories": "score_bedtime",
-    "🏖️ Beach Day": "score_beach",
-    "🧠 Make me Smarter": "score_educational",
-    "⚡ Adrenaline Rush": "score_adrenaline",
-}
-
 selected_mood_label = st.sidebar.selectbox(
     "Choose your mood",
     options=list(MOODS.keys())
@@ -65,32 +99,27 @@ min_rating = st.sidebar.slider(
 # ====================
 # BUILD df_view (THIS WAS MISSING)
 # ====================
-df_view = df.copy()
 
 # practical filters
-df_view = df_view[
-    (df_view["pages"].fillna(10_000) <= max_pages) &
-    (df_view["rating"].fillna(0) >= min_rating)
-]
+keep = (
+    (df["pages"].fillna(10_000) <= max_pages) &
+    (df["rating"].fillna(0) >= min_rating)
+).to_numpy()
 
-# mood logic
+# mood logic: walk the precomputed ranking, keep rows passing the filters
 if selected_strictness == "balanced":
-    df_view = df_view.sort_values(selected_mood_col, ascending=False)
+    order = rankings[selected_mood_col]
 
 elif selected_strictness == "best_only":
-    df_view = df_view[
-        df_view["top_mood"] == selected_mood_col
-    ].sort_values(
-        ["top_mood_score", "rating_count"],
-        ascending=[False, False]
-    )
+    order = rankings["best_only"]
+    keep = keep & (df["top_mood"] == selected_mood_col).to_numpy()
 
 elif selected_strictness == "broad":
     broad_col = f"{selected_mood_col}_broad"
-    df_view = df_view.sort_values(broad_col, ascending=False)
+    order = rankings[broad_col]
 
 # limit results early
-df_view = df_view.head(10)
+df_view = df.iloc[order[keep[order]][:10]]
 
 # ====================
 # RESULTS AREA — EXPANDERS
@@ -107,14 +136,14 @@ else:
     st.write(f"Found **{len(df_view)}** books matching your criteria.")
 
     # sort visually by rating
-    for _, row in df_view.sort_values("rating", ascending=False).iterrows():
-        with st.expander(f"{row['title']} — ⭐ {row['rating']:.2f}"):
-            st.write(f"**Author:** {row['author']}")
-            st.write(f"**Length:** {int(row['pages'])} pages")
+    for row in df_view.sort_values("rating", ascending=False).itertuples(index=False):
+        with st.expander(f"{row.title} — ⭐ {row.rating:.2f}"):
+            st.write(f"**Author:** {row.author}")
+            st.write(f"**Length:** {int(row.pages)} pages")
 
             st.markdown("**Description:**")
-            if pd.notna(row["description"]) and row["description"].strip():
-                st.write(row["description"])
+            if pd.notna(row.description) and row.description.strip():
+                st.write(row.description)
             else:
                 st.write("No description available for this title.")
 
@@ -3,25 +3,33 @@ crawl_listopia.py
 
 This script crawls a Goodreads Listopia list page (e.g. "Best Books Ever"),
 collects book detail URLs, visits each book page, extracts structured book
-information, and saves the results into a JSONL file.
+information, and saves the results into a gzip-compressed JSONL file.
 
 Features:
 - Pagination support
-- Polite crawling with random delays
+- Concurrent, rate-limited crawling (asyncio + httpx)
+- robots.txt rules and Crawl-delay honored
 - JSON-LD + HTML fallback parsing
 - Resume capability (skip already crawled books)
+- Refresh mode with conditional GETs (ETag / Last-Modified)
 - Failed URL logging
 """
 
-import json
-import random
+import asyncio
+import gzip
 import re
-import time
+import zlib
+from collections.abc import Collection, Iterable, Iterator
 from dataclasses import dataclass
+from functools import cache, partial
 from pathlib import Path
+from typing import BinaryIO, TextIO
+from urllib.parse import urljoin, urlsplit
+from urllib.robotparser import RobotFileParser
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import orjson
+from selectolax.lexbor import LexborHTMLParser
 from tqdm import tqdm
 
 
@@ -39,143 +47,383 @@ HEADERS = {
 
 BASE_URL = "https://www.goodreads.com"
 
-SESSION = requests.Session()
 HEADERS.update({
     "Accept-Language": "en-US,en;q=0.9",
     "Accept": "text/html,application/xhtml+xml",
 })
 
+# Every request goes to the same host, so one pooled client is shared by the
+# whole crawl (keep-alive / HTTP/2 instead of a new TLS handshake per page).
+CLIENT_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 YEAR_RE = re.compile(r"\b(18|19|20)\d{2}\b")
 PAGES_RE = re.compile(r"(\d+)\s+pages", re.IGNORECASE)
+PUBLISHED_RE = re.compile(
+    r"(first\s+published|published)\s+(?:.*?\s+)?(\b(18|19|20)\d{2}\b)",
+    re.IGNORECASE
+)
+LANG_RE = re.compile(
+    r"Language\s*[:\-]?\s*(English|Spanish|French|German|Italian)",
+    re.IGNORECASE
+)
+
+# CSS selectors used by the parsers
+BOOK_TITLE_SEL = "a.bookTitle"
+JSONLD_SEL = 'script[type="application/ld+json"]'
+DESCRIPTION_SELECTORS = (
+    '[data-testid="description"] .TruncatedContent__text',
+    '.BookPageMetadataSection__description .TruncatedContent__text',
+    '#description span',
+)
+OG_DESCRIPTION_SEL = 'meta[property="og:description"]'
+DETAILS_ITEM_SEL = ".BookDetails .BookDetails__listItem"
+PAGES_SELECTORS = (
+    '[data-testid="pagesFormat"]',
+    '.BookDetails__descriptionPages',
+)
+GENRE_SEL = "a.Button.Button--tag span.Button__labelItem"
 
 DATA_DIR = Path("data/raw")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-OUTPUT_JSONL = DATA_DIR / "goodreads_books.jsonl"
+OUTPUT_JSONL = DATA_DIR / "goodreads_books.jsonl.gz"
 FAILED_URLS = DATA_DIR / "failed_urls.txt"
 
+# Output files are opened once per crawl with a large buffer and flushed
+# every FLUSH_EVERY records instead of being reopened for each line.
+WRITE_BUFFER_SIZE = 1 << 20
+FLUSH_EVERY = 32
+# Level 1 is the cheapest gzip setting and still shrinks the records several
+# times over (long prose descriptions, repeated field names).
+GZIP_LEVEL = 1
+# What reading a damaged gzip stream can raise: a member cut off by a hard kill
+# ends early (EOFError) and anything appended after it no longer decodes.
+GZIP_READ_ERRORS = (EOFError, zlib.error, gzip.BadGzipFile)
+
 
 # ============================================================
 # HTTP helpers
 # ============================================================
 
-def fetch_html(url: str, timeout: int = 25, retries: int = 3) -> str:
+class DomainRateLimiter:
     """
-    Fetch HTML content from a URL with retry support.
+    Enforce a minimum delay between requests to the same host.
+
+    Each request reserves the next free slot for its host,
+    max(now, next_allowed_time), so time spent waiting on a slow response
+    counts towards the delay instead of being added on top of it.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self.next_allowed: dict[str, float] = {}
+
+    async def wait(self, url: str) -> None:
+        host = urlsplit(url).netloc
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self.next_allowed.get(host, now))
+        self.next_allowed[host] = slot + self.min_interval
+        await asyncio.sleep(slot - now)
+
+
+def make_client(timeout: int = 25) -> httpx.AsyncClient:
+    """
+    Create the shared HTTP client (connection pool + connect retries).
+    """
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=CLIENT_LIMITS, retries=3)
+    return httpx.AsyncClient(
+        transport=transport,
+        headers=HEADERS,
+        timeout=timeout,
+        follow_redirects=True,
+    )
+
+
+class FetchError(RuntimeError):
+    """
+    Raised when a URL cannot be fetched.
+    status_code is the HTTP status of the last response, or None if no
+    response was received (network / transport error).
+    """
+
+    def __init__(self, url: str, reason: object, status_code: int | None = None):
+        super().__init__(f"Failed to fetch {url}: {reason}")
+        self.status_code = status_code
+
+
+async def fetch_page(
+    client: httpx.AsyncClient,
+    limiter: DomainRateLimiter,
+    url: str,
+    retries: int = 3,
+    etag: str = "",
+    last_modified: str = "",
+) -> httpx.Response:
+    """
+    Fetch a URL with retry support and return the response.
+    Every attempt waits on the shared limiter, so the crawl as a whole never
+    exceeds the configured per-host request rate.
+    If etag / last_modified are given the request is conditional, and a
+    304 Not Modified response is returned as-is (no body).
+    Raises FetchError (a RuntimeError) once the URL cannot be fetched.
     """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
     last_error = None
-    for _ in range(retries):
+    last_status = None
+    for attempt in range(retries):
+        await limiter.wait(url)
         try:
-            response = SESSION.get(url, headers=HEADERS, timeout=timeout)
+            response = await client.get(url, headers=headers)
+            if response.status_code == 304:
+                return response
             response.raise_for_status()
-            return response.text
-        except Exception as e:
+            return response
+        except httpx.HTTPStatusError as e:
+            last_status = e.response.status_code
+            last_error = f"HTTP {last_status}"
+            if last_status not in RETRY_STATUSES:
+                raise FetchError(url, last_error, last_status) from e
+        except httpx.TransportError as e:
+            last_status = None
             last_error = e
-            time.sleep(random.uniform(1.0, 2.0))
-    raise RuntimeError(f"Failed to fetch {url}: {last_error}")
+        await asyncio.sleep(0.5 * 2 ** attempt)
+    raise FetchError(url, last_error, last_status)
+
+
+async def fetch_html(
+    client: httpx.AsyncClient,
+    limiter: DomainRateLimiter,
+    url: str,
+    retries: int = 3,
+) -> str:
+    """
+    Fetch HTML content from a URL with retry support.
+    """
+    response = await fetch_page(client, limiter, url, retries)
+    return response.text
 
 
-def polite_sleep(min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
+async def load_robots(
+    client: httpx.AsyncClient,
+    limiter: DomainRateLimiter,
+    robots_url: str,
+) -> RobotFileParser:
     """
-    Sleep for a random duration to avoid hitting rate limits.
+    Fetch and parse robots.txt once for the whole crawl.
+    Following RFC 9309 (and RobotFileParser.read): a 4xx response means
+    there is no robots.txt and everything is allowed, except 401/403, which
+    disallow everything, as does an unreachable server (5xx after retries,
+    or a network error).
     """
-    time.sleep(random.uniform(min_seconds, max_seconds))
+    robots = RobotFileParser(robots_url)
+    try:
+        text = await fetch_html(client, limiter, robots_url)
+    except FetchError as e:
+        status = e.status_code
+        if status is not None and 400 <= status < 500 and status not in (401, 403):
+            print(f"No robots.txt, allowing all URLs: {e}")
+            robots.allow_all = True
+        else:
+            print(f"Could not read robots.txt, disallowing all URLs: {e}")
+            robots.disallow_all = True
+        return robots
+    robots.parse(text.splitlines())
+    return robots
 
 
 # ============================================================
 # Storage helpers
 # ============================================================
 
-def load_existing_urls(jsonl_path: Path) -> set[str]:
+def load_existing_urls(jsonl_path: Path) -> dict[str, tuple[str, str]]:
     """
-    Load already crawled book URLs from an existing JSONL file.
-    Used to support resume-after-interruption.
+    Load already crawled book URLs from an existing JSONL(.gz) file, mapped to
+    the (etag, last_modified) validators stored with each record.
+    Used to support resume-after-interruption and refresh crawls.
+    A URL crawled more than once keeps the validators of its latest record.
     """
     if not jsonl_path.exists():
-        return set()
-
-    urls = set()
-    with jsonl_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                obj = json.loads(line)
-                if "book_url" in obj:
-                    urls.add(obj["book_url"])
-            except json.JSONDecodeError:
-                continue
+        return {}
+
+    urls = {}
+    with gzip.open(jsonl_path, "rb") as f:
+        try:
+            for line in f:
+                # Cheap prefilter: skip blank/unrelated lines without decoding them.
+                if b'"book_url"' not in line:
+                    continue
+                try:
+                    obj = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                url = obj.get("book_url") if isinstance(obj, dict) else None
+                if url:
+                    urls[url] = (obj.get("etag") or "", obj.get("last_modified") or "")
+        except GZIP_READ_ERRORS:
+            # Damaged gzip member (crawl killed before closing the file):
+            # everything before that point is still usable.
+            pass
     return urls
 
 
-def append_jsonl(path: Path, record: dict) -> None:
+def gzip_is_intact(path: Path) -> bool:
     """
-    Append a single JSON record to a JSONL file.
+    Check that a gzip file decompresses cleanly all the way to the end.
     """
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    try:
+        with gzip.open(path, "rb") as f:
+            while f.read(WRITE_BUFFER_SIZE):
+                pass
+    except GZIP_READ_ERRORS:
+        return False
+    return True
 
 
-def log_failed_url(path: Path, url: str, reason: str = "") -> None:
+def repair_jsonl(path: Path) -> None:
+    """
+    Make sure a gzip JSONL file can be appended to.
+    A crawl killed without closing the file (SIGKILL, OOM, power loss) leaves
+    a truncated gzip member at the end, and a member appended after it would
+    make the whole file unreadable. In that case the complete records before
+    the damage are copied into a fresh file, and the damaged original is kept
+    next to it with a .corrupt suffix.
+    """
+    if not path.exists() or gzip_is_intact(path):
+        return
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    salvaged = 0
+    with (
+        gzip.open(path, "rb") as src,
+        gzip.open(tmp_path, "wb", compresslevel=GZIP_LEVEL) as dst,
+    ):
+        try:
+            for line in src:
+                # A line without its newline was cut off mid-record.
+                if line.endswith(b"\n"):
+                    dst.write(line)
+                    salvaged += 1
+        except GZIP_READ_ERRORS:
+            pass
+
+    corrupt_path = path.with_name(path.name + ".corrupt")
+    path.replace(corrupt_path)
+    tmp_path.replace(path)
+    print(
+        f"{path} was damaged; salvaged {salvaged} lines into a fresh file "
+        f"(original kept at {corrupt_path})"
+    )
+
+
+def open_append(path: Path) -> TextIO:
+    """
+    Open a text file for buffered appending.
+    """
+    return path.open("a", buffering=WRITE_BUFFER_SIZE, encoding="utf-8")
+
+
+def open_jsonl_append(path: Path) -> BinaryIO:
+    """
+    Open a gzip-compressed JSONL file for appending (binary, records come
+    from orjson). Each crawl adds a new gzip member; gzip and pandas read the
+    concatenated members back as one stream, as long as repair_jsonl() has
+    run first.
+    """
+    return gzip.open(path, "ab", compresslevel=GZIP_LEVEL)
+
+
+def write_jsonl(out: BinaryIO, record: dict) -> None:
+    """
+    Write a single JSON record to an open JSONL file.
+    orjson emits UTF-8 directly, like json.dumps(..., ensure_ascii=False).
+    """
+    out.write(orjson.dumps(record))
+    out.write(b"\n")
+
+
+def log_failed_url(out: TextIO, url: str, reason: str = "") -> None:
     """
     Log failed URLs for later inspection or re-crawling.
     """
-    with path.open("a", encoding="utf-8") as f:
-        f.write(f"{url}\t{reason}\n")
+    out.write(f"{url}\t{reason}\n")
 
 
 # ============================================================
 # Listopia: collect book URLs
 # ============================================================
 
-def build_listopia_page_url(list_url: str, page: int) -> str:
+def build_listopia_page_url(list_url: str, page: int, sep: str | None = None) -> str:
     """
     Build paginated Listopia URL.
+    `sep` is the query separator ("?" or "&"); pass it in when building many
+    pages of the same list to avoid rescanning list_url each time.
     """
-    if "?" in list_url:
-        return f"{list_url}&page={page}"
-    return f"{list_url}?page={page}"
+    if sep is None:
+        sep = "&" if "?" in list_url else "?"
+    return f"{list_url}{sep}page={page}"
 
 
 def extract_book_urls_from_list_page(html: str) -> list[str]:
     """
     Extract book detail URLs from a Listopia page.
     """
-    soup = BeautifulSoup(html, "lxml")
+    tree = LexborHTMLParser(html)
     urls = []
+    seen: set[str] = set()
 
-    for a in soup.select("a.bookTitle"):
-        href = a.get("href", "")
+    for a in tree.css(BOOK_TITLE_SEL):
+        href = a.attributes.get("href") or ""
         if href.startswith("/book/show/"):
-            urls.append(BASE_URL + href.split("?")[0])
+            url = BASE_URL + href.partition("?")[0]
+            if url not in seen:
+                seen.add(url)
+                urls.append(url)
 
-    return list(dict.fromkeys(urls))
+    return urls
 
 
-def collect_book_urls(
+async def collect_book_urls(
+    client: httpx.AsyncClient,
+    limiter: DomainRateLimiter,
+    robots: RobotFileParser,
     list_url: str,
     target_count: int = 500,
-    max_pages: int = 60
+    max_pages: int = 60,
+    skip_urls: Collection[str] | None = None,
 ) -> list[str]:
     """
     Collect book URLs from Listopia pages until target_count is reached.
+    URLs in skip_urls (e.g. already crawled books) and URLs disallowed by
+    robots.txt are left out and do not count towards target_count.
     """
-    collected = []
+    user_agent = HEADERS["User-Agent"]
+    collected: list[str] = []
+    seen: set[str] = set(skip_urls) if skip_urls else set()
+    sep = "&" if "?" in list_url else "?"
 
     for page in range(1, max_pages + 1):
-        page_url = build_listopia_page_url(list_url, page)
-        html = fetch_html(page_url)
+        page_url = build_listopia_page_url(list_url, page, sep)
+        if not robots.can_fetch(user_agent, page_url):
+            continue
+        html = await fetch_html(client, limiter, page_url)
         page_urls = extract_book_urls_from_list_page(html)
 
         if not page_urls:
             break
 
         for url in page_urls:
-            if url not in collected:
+            if url not in seen and robots.can_fetch(user_agent, url):
+                seen.add(url)
                 collected.append(url)
             if len(collected) >= target_count:
                 return collected
 
-        polite_sleep(0.8, 2.0)
-
     return collected
 
 
@@ -183,59 +431,85 @@ def collect_book_urls(
 # Book detail parsing (JSON-LD + HTML fallback)
 # ============================================================
 
-def extract_description(soup: BeautifulSoup) -> str:
-    candidates = [
-        '[data-testid="description"] .TruncatedContent__text',
-        '.BookPageMetadataSection__description .TruncatedContent__text',
-        '#description span',
-    ]
-    for sel in candidates:
-        node = soup.select_one(sel)
+def collapse_whitespace(text: str) -> str:
+    """
+    Collapse runs of whitespace into single spaces and trim the ends.
+    Same result as re.sub(r"\s+", " ", text).strip(), but split/join runs
+    in C without the regex engine, which matters for multi-kB descriptions.
+    """
+    return " ".join(text.split())
+
+
+def extract_description(tree: LexborHTMLParser) -> str:
+    for sel in DESCRIPTION_SELECTORS:
+        node = tree.css_first(sel)
         if node:
-            text = re.sub(r"\s+", " ", node.get_text(" ", strip=True)).strip()
+            text = collapse_whitespace(node.text(separator=" ", strip=True))
             if len(text) >= 80:
                 return text
 
-    meta = soup.select_one('meta[property="og:description"]')
+    meta = tree.css_first(OG_DESCRIPTION_SEL)
     if meta:
-        content = re.sub(r"\s+", " ", meta.get("content", "").strip())
+        content = collapse_whitespace(meta.attributes.get("content") or "")
         return content
 
     return ""
 
-def extract_jsonld_blocks(soup: BeautifulSoup) -> list[dict]:
+def jsonld_texts(tree: LexborHTMLParser) -> list[str]:
     """
-    Extract all JSON-LD blocks from a page.
+    Return the raw (undecoded) text of every JSON-LD script on a page.
     """
-    blocks = []
-    for tag in soup.select('script[type="application/ld+json"]'):
-        raw = tag.get_text(strip=True)
+    return [tag.text(strip=True) for tag in tree.css(JSONLD_SEL)]
+
+
+def is_book_block(block: dict) -> bool:
+    return str(block.get("@type", "")).lower() == "book"
+
+
+def iter_jsonld_blocks(raws: Iterable[str]) -> Iterator[dict]:
+    """
+    Yield the JSON-LD blocks of the given script texts one at a time, in order.
+    Scripts are only decoded as the caller asks for more blocks.
+    """
+    for raw in raws:
         if not raw:
             continue
         try:
-            data = json.loads(raw)
-            if isinstance(data, list):
-                blocks.extend([x for x in data if isinstance(x, dict)])
-            elif isinstance(data, dict):
-                blocks.append(data)
-        except json.JSONDecodeError:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
             continue
-    return blocks
+        if isinstance(data, list):
+            yield from (x for x in data if isinstance(x, dict))
+        elif isinstance(data, dict):
+            yield data
 
 
-def select_book_jsonld(blocks: list[dict]) -> dict | None:
+def find_book_jsonld(tree: LexborHTMLParser) -> dict | None:
     """
-    Select the JSON-LD block that represents a Book.
+    Find the JSON-LD block that represents a Book.
+    Stops at the first Book block; otherwise falls back to the first block
+    that looks like one (has aggregateRating and author).
     """
-    for block in blocks:
-        if str(block.get("@type", "")).lower() == "book":
+    raws = jsonld_texts(tree)
+
+    # Fast path: only decode scripts that mention a "Book" @type at all.
+    # A substring check is far cheaper than decoding Organization,
+    # BreadcrumbList, ... blocks that are thrown away anyway.
+    for raw in raws:
+        if '"@type"' in raw and '"Book"' in raw:
+            for block in iter_jsonld_blocks([raw]):
+                if is_book_block(block):
+                    return block
+
+    # Slow path: the prefilter found no Book (e.g. "book" in lowercase),
+    # decode every block.
+    fallback = None
+    for block in iter_jsonld_blocks(raws):
+        if is_book_block(block):
             return block
-
-    for block in blocks:
-        if "aggregateRating" in block and "author" in block:
-            return block
-
-    return None
+        if fallback is None and "aggregateRating" in block and "author" in block:
+            fallback = block
+    return fallback
 
 
 def parse_book_from_jsonld(book: dict) -> dict:
@@ -267,7 +541,7 @@ def parse_book_from_jsonld(book: dict) -> dict:
         "author": author,
         "rating": rating,
         "rating_count": rating_count,
-        "description": re.sub(r"\s+", " ", book.get("description", "")).strip(),
+        "description": collapse_whitespace(book.get("description", "")),
         "isbn": book.get("isbn", ""),
         "image": image,
         "url_from_jsonld": book.get("url") or book.get("@id", ""),
@@ -275,70 +549,130 @@ def parse_book_from_jsonld(book: dict) -> dict:
     }
 
 
-def extract_pages(soup: BeautifulSoup) -> int | None:
-    text = soup.get_text(" ", strip=True)
-    match = PAGES_RE.search(text)
+def get_page_text(tree: LexborHTMLParser) -> str:
+    """
+    Return the visible text of the page body as a single string.
+    This walks the whole DOM, so compute it once per page and pass it to the
+    text-based extractors.
+    """
+    return tree.body.text(separator=" ", strip=True) if tree.body else ""
+
+
+def extract_pages(page_text: str) -> int | None:
+    match = PAGES_RE.search(page_text)
     return int(match.group(1)) if match else None
 
 
-PUBLISHED_RE = re.compile(
-    r"(first\s+published|published)\s+(?:.*?\s+)?(\b(18|19|20)\d{2}\b)",
-    re.IGNORECASE
-)
+def get_pages_details_text(tree: LexborHTMLParser) -> str | None:
+    """
+    Return the text of the book details panel that holds the page count
+    ("374 pages, Hardcover"), or None if the page has no such panel.
+    Scanning only this text is cheaper than scanning the full page text, and
+    cannot pick up a "500 pages" from a review.
+    """
+    for sel in PAGES_SELECTORS:
+        node = tree.css_first(sel)
+        if node:
+            return node.text()
+    return None
 
-def extract_published_year(soup: BeautifulSoup) -> int | None:
-    text = soup.get_text(" ", strip=True)
 
-    m = PUBLISHED_RE.search(text)
+def extract_published_year(page_text: str) -> int | None:
+    m = PUBLISHED_RE.search(page_text)
     if m:
         return int(m.group(2))
 
-    m2 = YEAR_RE.search(text)
+    m2 = YEAR_RE.search(page_text)
     return int(m2.group(0)) if m2 else None
 
 
-def extract_language(soup: BeautifulSoup) -> str:
-    for div in soup.select(".BookDetails .BookDetails__listItem"):
-        text = div.get_text(" ", strip=True)
+def extract_language(page_text: str) -> str:
+    m = LANG_RE.search(page_text)
+    return m.group(1) if m else ""
+
+
+def extract_language_from_details(tree: LexborHTMLParser) -> str:
+    """
+    DOM fallback for extract_language: read the "Language" row of the
+    book details panel.
+    """
+    for div in tree.css(DETAILS_ITEM_SEL):
+        text = div.text(separator=" ", strip=True)
         if text.lower().startswith("language"):
             parts = text.split()
             if len(parts) >= 2:
                 return parts[-1]
-
-    LANG_RE = re.compile(r"Language\s*[:\-]?\s*(English|Spanish|French|German|Italian)", re.IGNORECASE)
-    text = soup.get_text(" ", strip=True)
-    m = LANG_RE.search(text)
-    return m.group(1) if m else ""
+    return ""
 
 
-def extract_genres(soup: BeautifulSoup, top_k: int = 5) -> list[str]:
+def extract_genres(tree: LexborHTMLParser, top_k: int = 5) -> list[str]:
     genres = []
-    for span in soup.select("a.Button.Button--tag span.Button__labelItem"):
-        genres.append(span.get_text(strip=True))
-    return list(dict.fromkeys(genres))[:top_k]
+    seen = set()
+    for span in tree.css(GENRE_SEL):
+        if len(genres) >= top_k:
+            break
+        genre = span.text(strip=True)
+        if genre not in seen:
+            seen.add(genre)
+            genres.append(genre)
+    return genres
 
 
-def parse_full_book(book_url: str) -> dict:
-    html = fetch_html(book_url)
-    soup = BeautifulSoup(html, "lxml")
+def parse_book_page(html: str, book_url: str) -> dict:
+    tree = LexborHTMLParser(html)
 
-    blocks = extract_jsonld_blocks(soup)
-    book_json = select_book_jsonld(blocks)
+    book_json = find_book_jsonld(tree)
+    # JSON-LD is read, so drop script/style bodies to keep them out of the
+    # page text used by the regex-based extractors below.
+    tree.strip_tags(["script", "style"])
 
     data = parse_book_from_jsonld(book_json) if book_json else {}
     data["book_url"] = book_url
 
     if not data.get("description"):
-        data["description"] = extract_description(soup)
+        data["description"] = extract_description(tree)
 
-    data["pages"] = extract_pages(soup)
-    data["published_year"] = extract_published_year(soup)
+    # The full page text is a whole-DOM walk: only build it (once) if one of
+    # the text-based fallbacks below actually needs it.
+    page_text = cache(partial(get_page_text, tree))
+
+    # The full text is only scanned when the details panel is missing; a panel
+    # without a count (e.g. "Kindle Edition") means the page count is unknown.
+    pages_text = get_pages_details_text(tree)
+    if pages_text is None:
+        pages_text = page_text()
+    data["pages"] = extract_pages(pages_text)
+    data["published_year"] = extract_published_year(page_text())
 
     if not data.get("language"):
         data["language"] = ""
 
-    data["genres"] = extract_genres(soup)
+    data["genres"] = extract_genres(tree)
+
+    return data
+
+
+async def parse_full_book(
+    client: httpx.AsyncClient,
+    limiter: DomainRateLimiter,
+    book_url: str,
+    validators: tuple[str, str] | None = None,
+) -> dict | None:
+    """
+    Fetch and parse a book page.
+    Returns None if the page is unchanged since the record the validators
+    (etag, last_modified) came from, so the stored record can be kept.
+    """
+    etag, last_modified = validators or ("", "")
+    response = await fetch_page(
+        client, limiter, book_url, etag=etag, last_modified=last_modified
+    )
+    if response.status_code == 304:
+        return None
 
+    data = parse_book_page(response.text, book_url)
+    data["etag"] = response.headers.get("ETag", "")
+    data["last_modified"] = response.headers.get("Last-Modified", "")
     return data
 
 
@@ -351,43 +685,128 @@ class CrawlConfig:
     list_url: str = "https://www.goodreads.com/list/show/1.Best_Books_Ever"
     target_books: int = 500
     max_pages: int = 60
-    sleep_min: float = 1.2
-    sleep_max: float = 3.0
-
+    concurrency: int = 8
+    # Minimum seconds between requests to the same host (raised to the
+    # robots.txt Crawl-delay if that is longer).
+    request_interval: float = 1.5
+    # Re-request already crawled books (conditionally) and store new
+    # versions of the pages that changed.
+    refresh: bool = False
 
-def main():
-    config = CrawlConfig()
 
+async def jsonl_writer(queue: asyncio.Queue, out: BinaryIO) -> None:
+    """
+    Drain parsed records from the queue into the output file.
+    A single writer keeps appends serialized while books are fetched in parallel.
+    """
+    written = 0
+    while (record := await queue.get()) is not None:
+        write_jsonl(out, record)
+        written += 1
+        if written % FLUSH_EVERY == 0:
+            out.flush()
+
+
+async def crawl_books(
+    client: httpx.AsyncClient,
+    limiter: DomainRateLimiter,
+    robots: RobotFileParser,
+    urls: list[str],
+    concurrency: int,
+    out: BinaryIO,
+    failed: TextIO,
+    validators: dict[str, tuple[str, str]] | None = None,
+) -> None:
+    """
+    Fetch and parse book pages concurrently, at most `concurrency` in flight.
+    URLs with validators are fetched conditionally; unchanged pages are
+    not written again.
+    """
+    validators = validators or {}
+    sem = asyncio.Semaphore(concurrency)
+    write_queue: asyncio.Queue = asyncio.Queue()
+    writer = asyncio.create_task(jsonl_writer(write_queue, out))
+    progress = tqdm(total=len(urls), desc="Books")
+
+    async def crawl_one(url: str) -> None:
+        if not robots.can_fetch(HEADERS["User-Agent"], url):
+            log_failed_url(failed, url, "disallowed by robots.txt")
+        else:
+            async with sem:
+                try:
+                    record = await parse_full_book(
+                        client, limiter, url, validators.get(url)
+                    )
+                    if record is not None:
+                        await write_queue.put(record)
+                except Exception as e:
+                    log_failed_url(failed, url, str(e))
+        progress.update(1)
+
+    try:
+        await asyncio.gather(*(crawl_one(url) for url in urls))
+    finally:
+        await write_queue.put(None)
+        await writer
+        progress.close()
+
+
+async def crawl(config: CrawlConfig) -> None:
     print(f"List URL: {config.list_url}")
     print(f"Target number of books: {config.target_books}")
     print(f"Output file: {OUTPUT_JSONL}")
 
+    repair_jsonl(OUTPUT_JSONL)
     seen_urls = load_existing_urls(OUTPUT_JSONL)
     print(f"Already crawled books: {len(seen_urls)}")
 
-    print("\n[1/2] Collecting book URLs from Listopia...")
-    book_urls = collect_book_urls(
-        config.list_url,
-        target_count=config.target_books,
-        max_pages=config.max_pages,
-    )
-
-    todo_urls = [u for u in book_urls if u not in seen_urls]
-    print(f"Books to crawl: {len(todo_urls)}")
-
-    print("\n[2/2] Crawling book detail pages...")
-    for url in tqdm(todo_urls, desc="Books"):
-        try:
-            record = parse_full_book(url)
-            append_jsonl(OUTPUT_JSONL, record)
-        except Exception as e:
-            log_failed_url(FAILED_URLS, url, str(e))
-        polite_sleep(config.sleep_min, config.sleep_max)
+    limiter = DomainRateLimiter(config.request_interval)
+
+    async with make_client() as client:
+        robots = await load_robots(
+            client, limiter, urljoin(config.list_url, "/robots.txt")
+        )
+        crawl_delay = robots.crawl_delay(HEADERS["User-Agent"])
+        if crawl_delay:
+            limiter.min_interval = max(limiter.min_interval, float(crawl_delay))
+
+        print("\n[1/2] Collecting book URLs from Listopia...")
+        book_urls = await collect_book_urls(
+            client,
+            limiter,
+            robots,
+            config.list_url,
+            target_count=config.target_books,
+            max_pages=config.max_pages,
+            skip_urls=seen_urls,
+        )
+
+        print(f"Books to crawl: {len(book_urls)}")
+
+        if config.refresh:
+            book_urls += list(seen_urls)
+            print(f"Books to refresh: {len(seen_urls)}")
+
+        print("\n[2/2] Crawling book detail pages...")
+        # Closing the files flushes whatever is still buffered, including
+        # when the crawl is interrupted with Ctrl+C.
+        with (
+            open_jsonl_append(OUTPUT_JSONL) as out,
+            open_append(FAILED_URLS) as failed,
+        ):
+            await crawl_books(
+                client, limiter, robots, book_urls, config.concurrency, out, failed,
+                validators=seen_urls,
+            )
 
     print("\nCrawling completed.")
     print(f"Results saved to: {OUTPUT_JSONL}")
     print(f"Failed URLs logged to: {FAILED_URLS}")
 
 
+def main():
+    asyncio.run(crawl(CrawlConfig()))
+
+
 if __name__ == "__main__":
     main()
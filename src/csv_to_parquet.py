@@ -0,0 +1,15 @@
+import pandas as pd
+from pathlib import Path
+
+# ===== paths =====
+INPUT_CSV = Path("data/processed/df_final_scored_with_descriptions.csv")
+OUTPUT_PARQUET = Path("data/processed/df_final_scored_with_descriptions.parquet")
+
+# The Streamlit app reads the Parquet copy: it loads much faster than the CSV
+# and keeps the column dtypes, so re-run this after regenerating the CSV.
+df = pd.read_csv(INPUT_CSV)
+
+df.to_parquet(OUTPUT_PARQUET, engine="pyarrow", compression="zstd", index=False)
+
+print(f"Saved Parquet to: {OUTPUT_PARQUET}")
+print(f"Shape: {df.shape}")
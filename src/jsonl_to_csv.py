@@ -1,28 +1,22 @@
-import json
 import pandas as pd
 from pathlib import Path
 
 # ===== paths =====
-INPUT_JSONL = Path("data/raw/goodreads_books.jsonl")
+INPUT_JSONL = Path("data/raw/goodreads_books.jsonl.gz")
 OUTPUT_CSV = Path("data/processed/goodreads_books_2.csv")
 
 OUTPUT_CSV.parent.mkdir(parents=True, exist_ok=True)
 
-rows = []
+# dtype=False keeps every field exactly as crawled (e.g. rating stays a string)
+df = pd.read_json(INPUT_JSONL, lines=True, dtype=False, compression="gzip")
 
-with INPUT_JSONL.open("r", encoding="utf-8") as f:
-    for line in f:
-        line = line.strip()
-        if not line:
-            continue
-        rows.append(json.loads(line))
-
-df = pd.DataFrame(rows)
+# refresh crawls append a newer record when a page changed: keep the latest
+if "book_url" in df.columns:
+    df = df.drop_duplicates(subset="book_url", keep="last")
 
 if "genres" in df.columns:
-    df["genres"] = df["genres"].apply(
-        lambda x: ", ".join(x) if isinstance(x, list) else x
-    )
+    is_list = df["genres"].map(lambda x: isinstance(x, list))
+    df.loc[is_list, "genres"] = df.loc[is_list, "genres"].str.join(", ")
 
 df.to_csv(OUTPUT_CSV, index=False, encoding="utf-8-sig")
 